@@ -1,10 +1,32 @@
  #!/usr/bin/env python3
 import os
+import sys
+import re
+import glob
+import mmap
+import stat
+import fcntl
+import tempfile
 import time
+import hashlib
+import gzip
+import threading
+import itertools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import ijson
+import orjson
+from cachetools import TTLCache, cached
 import configparser
 import logging
-from flask import Flask, request, jsonify, redirect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import Flask, request, redirect
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger()
@@ -18,6 +40,8 @@ EXTERNAL_SERVER = config.get("xtream-remote", "server", fallback="http://remote-
 USERNAME = config.get("xtream-remote", "user", fallback="user")
 PASSWORD = config.get("xtream-remote", "pass", fallback="pass")
 USERAGENT = config.get("xtream-remote", "user-agent", fallback="okhttp/3.14.17")
+CACHE_DIR = config.get("xtream-proxy", "cache-dir",
+                       fallback="/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
 
 def read_list_section(section_name):
     """Read a section as a list of values (one per line)."""
@@ -25,23 +49,115 @@ def read_list_section(section_name):
         return set()
     return {item.strip() for item in config.options(section_name) if item.strip()}
 
-WHITELIST = read_list_section("whitelist")
-BLACKLIST = read_list_section("blacklist")
-WHITELIST_CATEGORY = read_list_section("whitelist-category")
+WHITELIST = frozenset(read_list_section("whitelist"))
+BLACKLIST = frozenset(read_list_section("blacklist"))
+WHITELIST_CATEGORY = frozenset(read_list_section("whitelist-category"))
+
+def build_matcher(terms):
+    """Build a function telling if any of the terms is found inside a name.
+
+    All terms are matched in a single pass over the name using a compiled
+    regex alternation.
+    """
+    if not terms:
+        return lambda name: False
+    pattern = re.compile("|".join(map(re.escape, terms)))
+    return lambda name: pattern.search(name) is not None
+
+def build_stream_matcher(whitelist, blacklist):
+    """Build a function telling if a name is (whitelisted, blacklisted).
+
+    With pyahocorasick, both lists go in a single Aho-Corasick automaton so
+    each name is scanned once in C, stopping at the first blacklist term.
+    Otherwise each list is matched with its own regex, blacklist first.
+    Blacklisted names are always (False, True), whatever their whitelist
+    terms.
+    """
+    if ahocorasick is None or not (whitelist or blacklist):
+        wl_match = build_matcher(whitelist)
+        bl_match = build_matcher(blacklist)
+        return lambda name: (False, True) if bl_match(name) else (wl_match(name), False)
+
+    automaton = ahocorasick.Automaton()
+    for term in whitelist:
+        automaton.add_word(term, False)
+    # added last, a term in both lists is blacklisted
+    for term in blacklist:
+        automaton.add_word(term, True)
+    automaton.make_automaton()
+
+    def match(name):
+        whitelisted = False
+        for _, blacklisted in automaton.iter(name):
+            if blacklisted:
+                return False, True
+            whitelisted = True
+        return whitelisted, False
+    return match
+
+# stream names are lowercased before matching, so must be the needles:
+# configparser already lowercases them, this guards against a case
+# preserving optionxform
+WHITELIST_LC = frozenset(w.lower() for w in WHITELIST)
+BLACKLIST_LC = frozenset(b.lower() for b in BLACKLIST)
 
-# used to add categories
-whitelist_category_updated = [x for x in WHITELIST_CATEGORY]
+stream_match = build_stream_matcher(WHITELIST_LC, BLACKLIST_LC)
+
+def private_dir(parent):
+    """Create, or check if already there, a directory only this user can access."""
+    path = os.path.join(parent, f"xtream_proxy-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    # parent may be world writable (/dev/shm): refuse a directory planted by others
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f"Cache directory {path} is not private to this user")
+    return path
 
 # Cache storage
-CACHE = {}
-LAST_REFRESH = {}
+# the cache is written to files shared by all worker processes, named
+# after the configuration so a config change never serves a stale cache
+CONFIG_ID = hashlib.blake2b(orjson.dumps([EXTERNAL_SERVER, USERNAME, sorted(WHITELIST),
+                                          sorted(BLACKLIST), sorted(WHITELIST_CATEGORY)]),
+                            digest_size=8).hexdigest()
+CACHE_PRIVATE_DIR = private_dir(CACHE_DIR)
+CACHE_PREFIX = os.path.join(CACHE_PRIVATE_DIR, f"xtream_{CONFIG_ID}")
+CACHE_INDEX = f"{CACHE_PREFIX}.index"
+CACHE_LOCK_FILE = f"{CACHE_PREFIX}.lock"
+CACHE_FAILED_FILE = f"{CACHE_PREFIX}.failed"  # touched when a refresh fails
+REFRESH_LOCK = threading.Lock()
+# the loaded cache, replaced as a whole so readers never mix two refreshes:
+# encoded bodies, their etags and gzipped bodies by action, refresh time
+# and mtime of the index the cache was loaded from
+CACHE = {"bytes": {}, "etag": {}, "gz": {}, "last_refresh": 0, "index_mtime": 0}
 REFRESH_INTERVAL = 24 * 3600  # once per day
+REFRESH_RETRY = 300  # wait after a failed refresh
+STREAM_ACTIONS = ["get_live_streams", "get_vod_streams", "get_series"]
+CATEGORY_ACTIONS = ["get_live_categories", "get_vod_categories", "get_series_categories"]
+# non cacheable actions, passed through to external with their id param
+PASSTHRU = {"get_series_info": "series_id",
+            "get_vod_info": "vod_id",
+            "get_simple_data_table": "stream_id"}
+FETCH_WORKERS = 6
+CHUNK_SIZE = 64 * 1024  # cached responses are sent in chunks of this size
+LOADING_RETRY_AFTER = 30  # seconds, told to clients until the cache is loaded
+# per asset requests (series info, vod info...) cache
+ID_CACHE_SIZE = 1024
+ID_CACHE_TTL = 3600
+
+# HTTP session shared by all downloads, keeps connections to external alive
+SESSION = requests.Session()
+SESSION.mount(f"{EXTERNAL_SERVER.split('://', 1)[0]}://",
+              HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                          max_retries=Retry(total=2, backoff_factor=0.2)))
+SESSION.headers.update({"User-Agent": USERAGENT})
 
 app = Flask(__name__)
 
-def fetch_external(action=None, extra_params=None):
-    """Fetch data from external Xtream Codes server."""
-    headers = {"User-Agent": USERAGENT}
+def request_external(action=None, extra_params=None, stream=False):
+    """Send a request to external Xtream Codes server."""
     params = {"username": USERNAME, "password": PASSWORD}
     if action:
         params["action"] = action
@@ -50,53 +166,89 @@ def fetch_external(action=None, extra_params=None):
     if extra_params:
         params.update(extra_params)
     logger.info("Downloading action: %s", action)
-    resp = requests.get(f"{EXTERNAL_SERVER}/player_api.php", headers=headers, params=params, timeout=10)
+    resp = SESSION.get(f"{EXTERNAL_SERVER}/player_api.php", params=params, timeout=10, stream=stream)
     resp.raise_for_status()
-    return resp.json()
+    return resp
+
+def fetch_external(action=None, extra_params=None):
+    """Fetch data from external Xtream Codes server."""
+    return orjson.loads(request_external(action, extra_params).content)
+
+def iter_external(action):
+    """Fetch a list from external Xtream Codes server, one item at a time.
+
+    The response is parsed while it is downloaded, so the whole list is
+    never held in memory. Anything else than a list (an error or auth
+    object) raises, instead of being taken as an empty list.
+    """
+    with request_external(action, stream=True) as resp:
+        resp.raw.decode_content = True
+        events = ijson.parse(resp.raw, use_float=True)
+        first = next(events, None)
+        if first is None or first[1] != "start_array":
+            raise ValueError(f"External response for {action} is not a list")
+        yield from ijson.items(itertools.chain([first], events), "item")
+
+@cached(TTLCache(maxsize=ID_CACHE_SIZE, ttl=ID_CACHE_TTL), lock=threading.Lock())
+def fetch_by_id(action, id_key, id_val):
+    """Fetch an asset from external Xtream Codes server, cached for a while."""
+    return fetch_external(action, {id_key: id_val})
+
+def fetch_filtered_streams(action, categories):
+    """Fetch streams from external Xtream Codes server and filter them."""
+    return filter_streams(iter_external(action), categories)
+
+def filter_streams(streams, categories,
+                   _match=stream_match, _wlc=WHITELIST_CATEGORY, _debug=logger.debug):
+    """Filter streams by unified whitelist/blacklist.
+
+    Params:
+    streams -- streams to filter
+    categories -- set where the categories of accepted streams are added
 
-def filter_streams(streams):
-    """Filter streams by unified whitelist/blacklist."""
-    global whitelist_category_updated
+    The underscore params bind globals as locals for the loop, they are not
+    meant to be passed.
+    """
     add_count = 0
     remove_count = 0
     filtered = []
+    add_stream = filtered.append
+    add_category = categories.add
     for s in streams:
-        name = str(s.get("name", "\0")).strip().lower()
-        category_id = s.get("category_id", "\0")
-        #logger.debug("Filtering name: %s", name)
-
-        # count the number of whitelist items that are found inside a stream name
-        # if that count is > 0, this is a whitelisted stream
-        match_list = [n for n in WHITELIST if n in name]
-        good_stream = len(match_list) > 0 or category_id in WHITELIST_CATEGORY
-        # same but for blacklist, this case more than 0 means it is blacklisted
-        match_list = [n for n in BLACKLIST if n in name]
-        bad_stream = len(match_list) > 0
-
-        if not good_stream or bad_stream:
+        # no strip needed: terms never have surrounding spaces
+        name = str(s.get("name", "\0")).lower()
+        category_id = s.get("category_id")
+
+        # any whitelist item found inside a stream name makes it whitelisted
+        # and any blacklist item found means it is blacklisted
+        whitelisted, blacklisted = _match(name)
+        if blacklisted or not (whitelisted or category_id in _wlc):
             remove_count += 1
             continue
 
-        category_id = s.get("category_id")
-        
-        logger.debug("Added name: %s", name)
+        _debug("Added name: %s", name)
         add_count += 1
         # add stream to good list
-        filtered.append(s)
+        add_stream(s)
         # add category is to good list
-        whitelist_category_updated.append(category_id)
+        add_category(category_id)
     logger.info("Filter done. Added:%d Removed:%d", add_count, remove_count)
     return filtered
 
-def filter_categories(categories):
-    """Filter categories by unified whitelist/blacklist."""
+def filter_categories(categories, allowed):
+    """Filter categories by unified whitelist/blacklist.
+
+    Params:
+    categories -- categories to filter
+    allowed -- set of allowed category ids, all are allowed if empty
+    """
     add_count = 0
     remove_count = 0
     filtered = []
     for c in categories:
         category_id = c.get("category_id", "\0")
 
-        if whitelist_category_updated and category_id not in whitelist_category_updated:
+        if allowed and category_id not in allowed:
             remove_count += 1
             continue
 
@@ -105,90 +257,265 @@ def filter_categories(categories):
     logger.info("Filter done. Added:%d Removed:%d", add_count, remove_count)
     return filtered
 
-def refresh_cache(action):
-    """Refresh cache once per day."""
-    stream_actions = ["get_live_streams", "get_vod_streams", "get_series"]
-    category_actions = ["get_live_categories", "get_vod_categories", "get_series_categores"]
-    category_streams = dict(zip(category_actions, stream_actions))
+def hide_server_info(server_info):
+    """Override external credentials and url in server info.
+
+    Malformed server info is discarded, as it could not be checked for
+    credentials.
+    """
+    try:
+        user_info = server_info.setdefault("user_info", {})
+        user_info["username"] = "-"
+        user_info["password"] = "-"
+        server_info.setdefault("server_info", {})["url"] = "-"
+    except (AttributeError, TypeError):
+        # some level is not a json object
+        logger.error("Server information from external is malformed")
+        return {}
+    return server_info
+
+def download_cache():
+    """Download and filter everything cached from external.
+
+    All the external downloads are done concurrently in two phases: first
+    server info and streams, then categories, as categories are filtered
+    using the ones found in the accepted streams. Streams are filtered
+    while they are downloaded.
+    """
+    new_cache = {}
+    # whitelisted categories plus the ones of accepted streams
+    categories = set(WHITELIST_CATEGORY)
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {executor.submit(fetch_filtered_streams, action, categories): action
+                   for action in STREAM_ACTIONS}
+        # no action maps to server_info
+        futures[executor.submit(fetch_external)] = None
+        for future in as_completed(futures):
+            action = futures[future]
+            if action is None:
+                new_cache["server_info"] = hide_server_info(future.result())
+            else:
+                new_cache[action] = future.result()
+
+        futures = {executor.submit(fetch_external, action): action
+                   for action in CATEGORY_ACTIONS}
+        for future in as_completed(futures):
+            new_cache[futures[future]] = filter_categories(future.result(), categories)
+    return new_cache
 
-    global LAST_REFRESH, CACHE
-    now = time.time()
+def cache_path(generation, key):
+    """Path of a cache file, generation changes on every refresh."""
+    return f"{CACHE_PREFIX}_{generation}_{key}.json"
 
-    # if invalid action
-    if action not in stream_actions + category_actions:
-        # action not supported
+def index_generation():
+    """Generation of the cache files in the index, None if there is none."""
+    try:
+        with open(CACHE_INDEX, "rb") as f:
+            return orjson.loads(f.read())["generation"]
+    except FileNotFoundError:
+        return None
+
+def sweep_cache(generation):
+    """Remove the cache files not belonging to generation.
+
+    Files of other configurations are removed once not written for two
+    refresh intervals, as no proxy running with them keeps them updated.
+    Removed files stay readable from the workers still mapping them.
+    """
+    current = f"{CACHE_PREFIX}_{generation}_"
+    expired = time.time() - 2 * REFRESH_INTERVAL
+    for path in glob.glob(os.path.join(CACHE_PRIVATE_DIR, "xtream_*")):
+        try:
+            if path.startswith(CACHE_PREFIX):
+                stale = path.endswith((".json", ".json.gz")) and not path.startswith(current)
+            else:
+                stale = os.path.getmtime(path) < expired
+            if stale:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def write_cache(new_cache, now):
+    """Write the cache files, encoded once for every worker and request.
+
+    Files left by failed writes are removed before writing, and the ones
+    of this write if it fails, so they never pile up in /dev/shm.
+    """
+    sweep_cache(index_generation())
+    generation = time.time_ns()
+    etags = {}
+    try:
+        for key, value in new_cache.items():
+            body = orjson.dumps(value)
+            etags[key] = hashlib.blake2b(body, digest_size=16).hexdigest()
+            path = cache_path(generation, key)
+            with open(path, "wb") as f:
+                f.write(body)
+            with open(f"{path}.gz", "wb") as f:
+                f.write(gzip.compress(body, compresslevel=6))
+
+        # the index is replaced last, it switches workers to the new files at once
+        index = {"generation": generation, "last_refresh": now, "etag": etags}
+        with open(f"{CACHE_INDEX}.tmp", "wb") as f:
+            f.write(orjson.dumps(index))
+        os.replace(f"{CACHE_INDEX}.tmp", CACHE_INDEX)
+    except Exception:
+        sweep_cache(index_generation())
+        raise
+
+    sweep_cache(generation)
+
+def map_file(path):
+    """Map a file in memory, read only."""
+    with open(path, "rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+def load_cache():
+    """Map the cache files of the last refresh, if not already mapped.
+
+    The files are shared memory pages, so every worker process serves them
+    without holding its own copy.
+    """
+    global CACHE
+
+    try:
+        mtime = os.stat(CACHE_INDEX).st_mtime_ns
+        if mtime == CACHE["index_mtime"]:
+            return
+        with open(CACHE_INDEX, "rb") as f:
+            index = orjson.loads(f.read())
+        new_bytes = {}
+        new_gz = {}
+        for key in index["etag"]:
+            path = cache_path(index["generation"], key)
+            new_bytes[key] = map_file(path)
+            new_gz[key] = map_file(f"{path}.gz")
+    except FileNotFoundError:
+        # no cache yet, or replaced while loading: try again later
         return
 
-    # no action maps to server_info
-    if not action:
-        action = "server_info"
+    CACHE = {"bytes": new_bytes, "etag": index["etag"], "gz": new_gz,
+             "last_refresh": index["last_refresh"], "index_mtime": mtime}
+
+def refresh_cache():
+    """Refresh cache once per day.
 
-    # get last refresh time per action
-    action_last_refresh = LAST_REFRESH.get(action, 0)
-    if now - action_last_refresh < REFRESH_INTERVAL:
+    Only one worker process downloads the cache, the others wait for it
+    and load its files. After a failed refresh, no worker tries again
+    before REFRESH_RETRY.
+    """
+    if time.time() - CACHE["last_refresh"] < REFRESH_INTERVAL:
         # no need to refresh cache
         return
 
-    if action == "server_info":
-        CACHE["server_info"] = fetch_external()
-        # override some server info
+    with REFRESH_LOCK, open(CACHE_LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        load_cache()
+        now = time.time()
+        if now - CACHE["last_refresh"] < REFRESH_INTERVAL:
+            # refreshed by another thread or worker while waiting for the lock
+            return
         try:
-            CACHE["server_info"]["user_info"]["username"] = "-"
-            CACHE["server_info"]["user_info"]["password"] = "-"
-            CACHE["server_info"]["server_info"]["url"] = "-"
-        except:
-            logger.error("Server information from external is malformed")
-    elif action in stream_actions:
-        CACHE[action] = filter_streams(fetch_external(action))
-    else:
-        # if a category is requested: first must be loaded the streams
-        stream_to_refresh = category_streams[action]
-        if now - LAST_REFRESH.get(stream_to_refresh, 0) > REFRESH_INTERVAL:
-            # TTL has expired
-            CACHE[stream_to_refresh] = filter_streams(fetch_external(stream_to_refresh))
-        # refresh the category
-        CACHE[action] = filter_categories(fetch_external(action))
+            if now - os.path.getmtime(CACHE_FAILED_FILE) < REFRESH_RETRY:
+                logger.info("Cache refresh failed recently, not retrying yet")
+                return
+        except FileNotFoundError:
+            pass
+        try:
+            write_cache(download_cache(), now)
+        except Exception:
+            # shared with the other workers waiting for the lock
+            with open(CACHE_FAILED_FILE, "w"):
+                pass
+            os.utime(CACHE_FAILED_FILE)
+            raise
+        load_cache()
 
-    LAST_REFRESH[action] = now
+def refresher():
+    """Refresh the cache in background when it expires.
 
-def get_noncacheable_action(args):
-    """
-    Params:
-    args -- http request querystrings
+    The first refresh happens right away, cached actions answer 503 until
+    it is done.
     """
-    action = args.get("action")
-    asset = action.split("_")[1]
-    if asset == "simple":
-        asset_str = "get_simple_data_table"
-        asset_id = args.get("stream_id")
-    else:
-        asset_str = f"get_{asset}_info"
-        asset_id = args.get(f"{asset}_id")
-    return fetch_external(action, {asset_srt: asset_id})
+    while True:
+        time.sleep(max(0, CACHE["last_refresh"] + REFRESH_INTERVAL - time.time()))
+        try:
+            refresh_cache()
+        except Exception:
+            logger.exception("Cache refresh failed")
+        if time.time() - CACHE["last_refresh"] >= REFRESH_INTERVAL:
+            # failed here or in another worker
+            logger.info("Cache not refreshed, retrying in %d seconds", REFRESH_RETRY)
+            time.sleep(REFRESH_RETRY)
 
-def get_action(args):
-    """
-    Params:
-    args -- http request querystrings
+def start_refresher():
+    """Load the cache and keep it refreshed from a background thread.
+
+    Nothing is downloaded at import, so a slow external server does not
+    hold the WSGI worker boot (and hit gunicorn worker timeout).
     """
-    non_cacheable_actions = ["get_series_info",
-                            "get_vod_info",
-                            "get_simple_data_table"]
+    threading.Thread(target=refresher, name="refresher", daemon=True).start()
 
-    action = args.get("action")
-    refresh_cache(action)
+def fast_jsonify(obj):
+    """Build a JSON response, encoded with orjson."""
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
 
-    if action in non_cacheable_actions:
-        return get_noncacheable_action(args)
-    if not action:
-        return CACHE.get("server_info", {})
+def chunk_iter(body):
+    """Yield body in chunks, copying one chunk at a time."""
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield bytes(body[start:start + CHUNK_SIZE])
 
-    return CACHE.get(action, [])
+def cached_response(action):
+    """Build a JSON response from the pre-encoded cache.
+
+    The response carries an ETag and can be cached by clients until the
+    next refresh; a matching If-None-Match gets a 304 without body. Clients
+    accepting gzip get the body compressed at refresh time. The body is
+    sent in chunks from the cached buffer, shared by all requests.
+    Until the first refresh is done, a 503 tells clients to come back later.
+    """
+    load_cache()
+    # one snapshot for the whole response, the cache may be replaced meanwhile
+    cache = CACHE
+    if not cache["last_refresh"]:
+        # an empty catalog would look valid and be kept by clients
+        resp = app.response_class("Cache is loading, retry later", status=503,
+                                  mimetype="text/plain")
+        resp.retry_after = LOADING_RETRY_AFTER
+        return resp
+    if not action:
+        action = "server_info"
+        body = cache["bytes"].get(action, b"{}")
+    else:
+        body = cache["bytes"].get(action, b"[]")
+    etag = cache["etag"].get(action)
+    # "gzip;q=0" is listed but refused, so check its quality
+    use_gzip = action in cache["gz"] and request.accept_encodings["gzip"] > 0
+    if use_gzip:
+        body = cache["gz"][action]
+        # each encoding is a different representation
+        etag = f"{etag}-gz"
+    resp = app.response_class(chunk_iter(body), mimetype="application/json")
+    resp.content_length = len(body)
+    resp.vary.add("Accept-Encoding")
+    if use_gzip:
+        resp.content_encoding = "gzip"
+    if etag:
+        resp.set_etag(etag)
+        resp.cache_control.public = True
+        resp.cache_control.max_age = max(0, int(cache["last_refresh"] + REFRESH_INTERVAL - time.time()))
+    return resp.make_conditional(request)
 
 @app.route("/player_api.php")
 def local_api():
     """Proxy API with filtering and caching."""
-    return jsonify(get_action(request.args))
+    action = request.args.get("action")
+
+    id_key = PASSTHRU.get(action)
+    if id_key:
+        return fast_jsonify(fetch_by_id(action, id_key, request.args.get(id_key)))
+
+    return cached_response(action)
 
 @app.route("/<asset>/<user>/<passwd>/<name>")
 def redirect_external_server(asset=None, user=None, passwd=None, name=None):
@@ -197,9 +524,12 @@ def redirect_external_server(asset=None, user=None, passwd=None, name=None):
     location = f"{EXTERNAL_SERVER}/{asset}/{USERNAME}/{PASSWORD}/{name}"
     logger.info("Redirecting to: %s", location)
     return redirect(location, code=307)
-    
+
+logger.info("Whitelist: %s", WHITELIST)
+logger.info("Blacklist: %s", BLACKLIST)
+logger.info("Whitelist Category: %s", WHITELIST_CATEGORY)
+start_refresher()
+
 if __name__ == "__main__":
-    logger.info("Whitelist: %s", WHITELIST)
-    logger.info("Blacklist: %s", BLACKLIST)
-    logger.info("Whitelist Category: %s", WHITELIST_CATEGORY)
-    app.run(host="0.0.0.0", port=8000)
+    sys.exit("Run with a WSGI server, for example:\n"
+             "gunicorn -k gthread -w 4 --threads 4 -b 0.0.0.0:8000 xtream_proxy:app")